@@ -5,17 +5,16 @@ Orchestrates data fetching, normalization, and aura generation.
 
 import os
 import sys
+import math
 import argparse
-import hashlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import numpy as np
-
-from src.data_loader import load_github_stats, GitHubStats
-from src.generative_engine import AuraGenerator
-from src.renderer import render_aura
+# NumPy, requests, the generative engine and the renderer are imported
+# lazily in generate_aura_svg so --help and argument errors stay fast.
+if TYPE_CHECKING:
+    from src.data_loader import GitHubStats
 
 
 # Configure logging
@@ -32,11 +31,18 @@ class StatsNormalizer:
     Uses sigmoid and logarithmic scaling to handle outliers.
     """
     
+    __slots__ = ()
+    
     # Reference values for normalization (based on typical GitHub activity)
     REF_COMMITS = 500       # Median-ish yearly commits for active devs
     REF_STREAK = 30         # 30-day streak is notable
     MAX_COMMITS = 5000      # Cap for extremely active users
     MAX_STREAK = 365        # Maximum streak is a year
+    INV_MAX_ENTROPY = 1.0 / math.log2(4)  # Entropy ceiling for 4 time buckets
+    
+    # Derived constants, computed once at class creation
+    LOG1P_MAX_COMMITS = math.log1p(MAX_COMMITS)
+    INV_MAX_STREAK = 1.0 / MAX_STREAK
     
     @staticmethod
     def sigmoid(x: float, midpoint: float = 0.5, steepness: float = 10.0) -> float:
@@ -51,17 +57,27 @@ class StatsNormalizer:
         Returns:
             Normalized value between 0 and 1.
         """
-        return 1 / (1 + np.exp(-steepness * (x - midpoint)))
+        # Scalar math avoids NumPy ufunc dispatch; branch keeps exp() from overflowing
+        z = steepness * (x - midpoint)
+        if z >= 0:
+            return 1.0 / (1.0 + math.exp(-z))
+        e = math.exp(z)
+        return e / (1.0 + e)
     
-    @staticmethod
-    def log_scale(value: float, reference: float, max_val: float) -> float:
+    @classmethod
+    def log_scale(
+        cls,
+        value: float,
+        reference: float,
+        max_val: Optional[float] = None
+    ) -> float:
         """
         Logarithmic scaling for handling wide value ranges.
         
         Args:
             value: Raw value to normalize.
             reference: Reference value for scaling.
-            max_val: Maximum expected value.
+            max_val: Maximum expected value (defaults to MAX_COMMITS).
             
         Returns:
             Normalized value between 0 and 1.
@@ -70,7 +86,8 @@ class StatsNormalizer:
             return 0.0
         
         # Log scale with reference point
-        log_val = np.log1p(value) / np.log1p(max_val)
+        log_max = cls.LOG1P_MAX_COMMITS if max_val is None else math.log1p(max_val)
+        log_val = math.log1p(value) / log_max
         return min(1.0, log_val)
     
     def normalize_density(self, total_commits: int) -> float:
@@ -84,7 +101,7 @@ class StatsNormalizer:
         Returns:
             Density value between 0 and 1.
         """
-        return self.log_scale(total_commits, self.REF_COMMITS, self.MAX_COMMITS)
+        return self.log_scale(total_commits, self.REF_COMMITS)
     
     def normalize_intensity(self, max_streak: int) -> float:
         """
@@ -96,7 +113,7 @@ class StatsNormalizer:
         Returns:
             Intensity value between 0 and 1.
         """
-        raw = max_streak / self.MAX_STREAK
+        raw = max_streak * self.INV_MAX_STREAK
         # Apply sigmoid for smoother distribution
         return self.sigmoid(raw, midpoint=0.15, steepness=8.0)
     
@@ -122,25 +139,23 @@ class StatsNormalizer:
         if total == 0:
             return 0.5  # Default to medium chaos
         
-        # Normalize to proportions
-        proportions = [c / total for c in counts]
-        
         # Calculate entropy (measure of randomness)
         # High entropy = uniform distribution = high chaos
+        # Plain math: four scalars are far cheaper than a NumPy round-trip
         entropy = 0.0
-        for p in proportions:
-            if p > 0:
-                entropy -= p * np.log2(p)
+        for count in counts:
+            if count > 0:
+                p = count / total
+                entropy -= p * math.log2(p)
         
         # Max entropy for 4 categories is log2(4) = 2
-        max_entropy = 2.0
-        normalized_entropy = entropy / max_entropy
+        normalized_entropy = entropy * self.INV_MAX_ENTROPY
         
         # Map to chaos: uniform distribution (high entropy) = high chaos
         # Concentrated distribution (low entropy) = low chaos (smooth curves)
         return normalized_entropy
     
-    def normalize_stats(self, stats: GitHubStats) -> dict:
+    def normalize_stats(self, stats: "GitHubStats") -> dict:
         """
         Normalize all stats for aura generation.
         
@@ -159,34 +174,38 @@ class StatsNormalizer:
         }
 
 
-def generate_aura(
+def generate_aura_svg(
     username: str,
     token: Optional[str] = None,
-    output_path: str = "aura.svg",
     width: int = 800,
     height: int = 800,
-    animate: bool = True
+    animate: bool = True,
+    use_cache: bool = True
 ) -> str:
     """
-    Generate an aura SVG for a GitHub user.
+    Generate aura SVG markup for a GitHub user without touching disk.
     
     Args:
         username: GitHub username.
         token: GitHub token (falls back to GITHUB_TOKEN env var).
-        output_path: Output SVG path.
         width: SVG width.
         height: SVG height.
         animate: Whether to add animation.
+        use_cache: Whether to reuse cached GitHub API responses.
         
     Returns:
-        Path to generated SVG.
+        SVG document as a string.
     """
+    from src.data_loader import load_github_stats
+    from src.generative_engine import AuraGenerator
+    from src.renderer import build_aura_svg
+    
     logger.info(f"Generating aura for user: {username}")
     
     # Step 1: Fetch GitHub stats
     logger.info("Fetching GitHub statistics...")
     try:
-        stats = load_github_stats(username, token)
+        stats = load_github_stats(username, token, use_cache=use_cache)
         logger.info(f"Fetched stats: {stats['total_commits']} commits, "
                    f"{stats['max_streak']} day streak, "
                    f"{len(stats['top_languages'])} languages")
@@ -220,38 +239,74 @@ def generate_aura(
     
     # Step 4: Render SVG
     logger.info("Rendering SVG...")
-    output_file = render_aura(
+    return build_aura_svg(
         paths_with_opacity=paths,
         languages=normalized["languages"],
         glow_intensity=normalized["intensity"],
-        output_path=output_path,
         width=width,
         height=height,
         animate=animate
     )
+
+
+def generate_aura(
+    username: str,
+    token: Optional[str] = None,
+    output_path: str = "aura.svg",
+    width: int = 800,
+    height: int = 800,
+    animate: bool = True,
+    use_cache: bool = True
+) -> str:
+    """
+    Generate an aura SVG for a GitHub user.
     
-    logger.info(f"Aura saved to: {output_file}")
-    return output_file
+    Args:
+        username: GitHub username.
+        token: GitHub token (falls back to GITHUB_TOKEN env var).
+        output_path: Output SVG path.
+        width: SVG width.
+        height: SVG height.
+        animate: Whether to add animation.
+        use_cache: Whether to reuse cached GitHub API responses.
+        
+    Returns:
+        Path to generated SVG.
+    """
+    svg = generate_aura_svg(
+        username,
+        token,
+        width=width,
+        height=height,
+        animate=animate,
+        use_cache=use_cache
+    )
+    Path(output_path).write_bytes(svg.encode("utf-8"))
+    
+    logger.info(f"Aura saved to: {output_path}")
+    return output_path
 
 
-def get_file_hash(filepath: str) -> Optional[str]:
+def write_if_changed(content: bytes, filepath: str) -> bool:
     """
-    Calculate SHA256 hash of a file.
+    Write content to a file only if it differs from what is on disk.
     
     Args:
-        filepath: Path to file.
+        content: New file content.
+        filepath: Destination path.
         
     Returns:
-        Hex digest of file hash, or None if file doesn't exist.
+        True if the file was written, False if it was already identical.
     """
-    if not os.path.exists(filepath):
-        return None
+    path = Path(filepath)
+    try:
+        if path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
     
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    path.write_bytes(content)
+    return True
 
 
 def main():
@@ -286,6 +341,11 @@ def main():
         action="store_true",
         help="Disable SVG animation"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the GitHub API instead of the on-disk cache"
+    )
     parser.add_argument(
         "--check-changes",
         action="store_true",
@@ -315,32 +375,34 @@ def main():
         logger.error("GITHUB_TOKEN environment variable required.")
         sys.exit(1)
     
-    # Get hash of existing file for change detection
-    old_hash = None
-    if args.check_changes:
-        old_hash = get_file_hash(args.output)
-    
     try:
-        # Generate aura
-        output_file = generate_aura(
-            username=username,
-            token=token,
-            output_path=args.output,
-            width=args.width,
-            height=args.height,
-            animate=not args.no_animation
-        )
-        
-        # Check if file changed
         if args.check_changes:
-            new_hash = get_file_hash(output_file)
-            if old_hash == new_hash:
+            # Compare in memory against the existing file; identical output is never rewritten
+            svg = generate_aura_svg(
+                username=username,
+                token=token,
+                width=args.width,
+                height=args.height,
+                animate=not args.no_animation,
+                use_cache=not args.no_cache
+            )
+            if write_if_changed(svg.encode("utf-8"), args.output):
+                logger.info(f"Aura content changed. Saved to: {args.output}")
+                print("AURA_CHANGED=true")
+            else:
                 logger.info("No changes detected in generated aura.")
-                # Signal no changes via exit code
+                # Signal no changes via output flag
                 print("AURA_CHANGED=false")
-            else:
-                logger.info("Aura content changed.")
-                print("AURA_CHANGED=true")
+        else:
+            generate_aura(
+                username=username,
+                token=token,
+                output_path=args.output,
+                width=args.width,
+                height=args.height,
+                animate=not args.no_animation,
+                use_cache=not args.no_cache
+            )
         
         logger.info("Aura generation complete!")
         
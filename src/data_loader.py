@@ -4,9 +4,88 @@ Fetches GitHub user statistics via GraphQL API.
 """
 
 import os
+import time
+import heapq
+import hashlib
+import functools
+import tempfile
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from operator import itemgetter
+from pathlib import Path
 from typing import TypedDict, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+
+# On-disk cache for GraphQL responses
+CACHE_DIR = Path.home() / ".cache" / "git-aura"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Stats, contribution calendar, commit history and languages in one request
+_USER_STATS_QUERY = """
+query($username: String!, $from: DateTime!, $to: DateTime!) {
+    user(login: $username) {
+        id
+        databaseId
+        contributionsCollection(from: $from, to: $to) {
+            totalCommitContributions
+            contributionCalendar {
+                weeks {
+                    contributionDays {
+                        contributionCount
+                    }
+                }
+            }
+            commitContributionsByRepository(maxRepositories: 10) {
+                repository {
+                    name
+                    defaultBranchRef {
+                        target {
+                            ... on Commit {
+                                history(first: 50) {
+                                    nodes {
+                                        committedDate
+                                        author {
+                                            user {
+                                                login
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        repositories(first: 100, ownerAffiliations: OWNER, orderBy: {field: UPDATED_AT, direction: DESC}) {
+            nodes {
+                languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+                    edges {
+                        size
+                        node {
+                            name
+                            color
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# Response path of the commit-history selection; errors under it are not fatal
+_COMMIT_HISTORY_PATH = ["user", "contributionsCollection", "commitContributionsByRepository"]
+
+
+@functools.lru_cache(maxsize=8)
+def _payload_prefix(query: str) -> bytes:
+    """Serialized '{"query": ...' prefix, reused across calls with the same query."""
+    return orjson.dumps({"query": query})[:-1]
 
 
 class LanguageData(TypedDict):
@@ -34,24 +113,110 @@ class GitHubStats(TypedDict):
     commit_time_distribution: CommitTimeDistribution
 
 
+def _streak_from_bits(bits: np.ndarray) -> int:
+    """
+    Find the longest run of non-zero entries in a day-activity array.
+    
+    Args:
+        bits: 1-D int8 array, 1 for days with contributions and 0 otherwise.
+        
+    Returns:
+        Length of the longest run of active days.
+    """
+    # Pad with zeros so every run has a rising and a falling edge
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], bits, [0]))))
+    return int((edges[1::2] - edges[::2]).max(initial=0))
+
+
+def _cached_query(method):
+    """
+    Decorator that caches GraphQL responses on disk.
+    
+    Responses are keyed by a SHA256 of the query and its variables, so the
+    date range baked into the variables limits reuse to the same day.
+    Entries older than CACHE_TTL_SECONDS are refetched.
+    """
+    @functools.wraps(method)
+    def wrapper(self, query: str, variables: Optional[dict] = None) -> dict:
+        if not self.use_cache:
+            return method(self, query, variables)
+        
+        key_source = orjson.dumps([query, variables], option=orjson.OPT_SORT_KEYS)
+        key = hashlib.sha256(key_source).hexdigest()
+        cache_file = self.cache_dir / f"{key}.json"
+        
+        # Serve from cache if the entry is fresh and readable
+        try:
+            if time.time() - cache_file.stat().st_mtime < CACHE_TTL_SECONDS:
+                return orjson.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+        
+        data = method(self, query, variables)
+        
+        # Write atomically so concurrent runs never see a partial file
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(data))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass  # Caching is best-effort
+        
+        return data
+    
+    return wrapper
+
+
 class GitHubDataLoader:
     """Fetches and processes GitHub user data via GraphQL API."""
     
     GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
     
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize the data loader.
         
         Args:
             token: GitHub Personal Access Token with read:user scope.
+            use_cache: Whether to cache API responses on disk.
+            cache_dir: Cache directory (defaults to CACHE_DIR).
         """
         self.token = token
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        
+        # Reuse one keep-alive connection; retry transient gateway errors.
+        # GraphQL queries are read-only, so retrying POST is safe here.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False  # Hand the last 5xx back so its body gets reported
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+        )
     
+    @_cached_query
     def _execute_query(self, query: str, variables: Optional[dict] = None) -> dict:
         """
         Execute a GraphQL query against GitHub API.
@@ -64,26 +229,72 @@ class GitHubDataLoader:
             JSON response data.
             
         Raises:
-            requests.RequestException: On API errors.
+            requests.HTTPError: On HTTP errors, including GitHub's error message.
+            ValueError: On GraphQL errors outside the commit history, or a
+                malformed response body.
         """
-        payload = {"query": query}
+        # Splice per-call variables onto the cached query prefix
+        payload = _payload_prefix(query)
         if variables:
-            payload["variables"] = variables
+            payload += b',"variables":' + orjson.dumps(variables)
+        payload += b"}"
             
-        response = requests.post(
+        # Content-Type: application/json is already set on the session
+        response = self.session.post(
             self.GRAPHQL_ENDPOINT,
-            json=payload,
-            headers=self.headers,
+            data=payload,
             timeout=30
         )
-        response.raise_for_status()
         
-        data = response.json()
+        # Decode before checking the status so HTTP errors can carry
+        # GitHub's own message (bad credentials, rate limit, ...)
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            data = None
+        
+        if not response.ok:
+            detail = (data.get("message") or data.get("errors")) if isinstance(data, dict) else None
+            raise requests.HTTPError(
+                f"{response.status_code} {response.reason} for {response.url}: "
+                f"{detail or response.text[:200]}",
+                response=response
+            )
+        
+        if not isinstance(data, dict):
+            raise ValueError("GitHub API returned a non-JSON response")
         if "errors" in data:
-            raise ValueError(f"GraphQL errors: {data['errors']}")
+            self._drop_commit_history_errors(data)
             
         return data["data"]
     
+    @staticmethod
+    def _drop_commit_history_errors(data: dict) -> None:
+        """
+        Tolerate GraphQL errors confined to the commit-history selection.
+        
+        Commit history is only used for the time distribution, which has a
+        fallback, so errors under it (e.g. SAML-protected repositories) must
+        not fail the whole run. The partial history is discarded.
+        
+        Args:
+            data: Decoded response containing an "errors" list.
+            
+        Raises:
+            ValueError: If any error lies outside the commit-history path.
+        """
+        user = (data.get("data") or {}).get("user")
+        contributions = (user or {}).get("contributionsCollection")
+        depth = len(_COMMIT_HISTORY_PATH)
+        
+        if not contributions or not all(
+            (error.get("path") or [])[:depth] == _COMMIT_HISTORY_PATH
+            for error in data["errors"]
+        ):
+            raise ValueError(f"GraphQL errors: {data['errors']}")
+        
+        contributions["commitContributionsByRepository"] = None
+    
     def fetch_user_stats(self, username: str) -> GitHubStats:
         """
         Fetch comprehensive GitHub statistics for a user.
@@ -95,43 +306,10 @@ class GitHubDataLoader:
             GitHubStats containing all metrics for aura generation.
         """
         # Calculate date range for last 12 months
-        now = datetime.utcnow()
-        one_year_ago = now - timedelta(days=365)
-        from_date = one_year_ago.strftime("%Y-%m-%dT00:00:00Z")
-        to_date = now.strftime("%Y-%m-%dT23:59:59Z")
-        
-        query = """
-        query($username: String!, $from: DateTime!, $to: DateTime!) {
-            user(login: $username) {
-                id
-                databaseId
-                contributionsCollection(from: $from, to: $to) {
-                    totalCommitContributions
-                    contributionCalendar {
-                        weeks {
-                            contributionDays {
-                                contributionCount
-                                date
-                            }
-                        }
-                    }
-                }
-                repositories(first: 100, ownerAffiliations: OWNER, orderBy: {field: UPDATED_AT, direction: DESC}) {
-                    nodes {
-                        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
-                            edges {
-                                size
-                                node {
-                                    name
-                                    color
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
+        # Day granularity keeps the query (and its cache key) stable all day
+        today = datetime.now(timezone.utc).date()
+        from_date = f"{today - timedelta(days=365)}T00:00:00Z"
+        to_date = f"{today}T23:59:59Z"
         
         variables = {
             "username": username,
@@ -139,30 +317,35 @@ class GitHubDataLoader:
             "to": to_date
         }
         
-        data = self._execute_query(query, variables)
+        # Single round-trip: stats, calendar, languages and commit history
+        data = self._execute_query(_USER_STATS_QUERY, variables)
         user_data = data["user"]
+        contributions = user_data["contributionsCollection"]
         
         # Extract basic stats
-        total_commits = user_data["contributionsCollection"]["totalCommitContributions"]
+        total_commits = contributions["totalCommitContributions"]
         user_id = user_data["databaseId"]
         
         # Calculate max streak from contribution calendar
         max_streak = self._calculate_max_streak(
-            user_data["contributionsCollection"]["contributionCalendar"]["weeks"]
+            contributions["contributionCalendar"]["weeks"]
         )
         
-        # Aggregate language usage across repositories
-        top_languages = self._aggregate_languages(user_data["repositories"]["nodes"])
+        # Aggregate language usage across repositories (top 3 languages)
+        top_languages = self._aggregate_languages(user_data["repositories"]["nodes"], top_n=3)
         
-        # Fetch commit time distribution (requires separate query for commit details)
-        commit_time_distribution = self._fetch_commit_time_distribution(username, from_date, to_date)
+        # Bucket commit times from the default-branch history of active repos
+        commit_time_distribution = self._calculate_commit_time_distribution(
+            contributions.get("commitContributionsByRepository") or [],
+            username
+        )
         
         return GitHubStats(
             username=username,
             user_id=user_id,
             total_commits=total_commits,
             max_streak=max_streak,
-            top_languages=top_languages[:3],  # Top 3 languages
+            top_languages=top_languages,
             commit_time_distribution=commit_time_distribution
         )
     
@@ -176,126 +359,74 @@ class GitHubDataLoader:
         Returns:
             Maximum streak length in days.
         """
-        all_days = []
-        for week in weeks:
-            for day in week["contributionDays"]:
-                all_days.append(day["contributionCount"] > 0)
-        
-        max_streak = 0
-        current_streak = 0
-        
-        for has_contribution in all_days:
-            if has_contribution:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 0
-                
-        return max_streak
+        # Size the buffer up front (53-54 weeks) so fromiter never regrows it
+        num_days = sum(len(week["contributionDays"]) for week in weeks)
+        bits = np.fromiter(
+            (day["contributionCount"] > 0 for week in weeks for day in week["contributionDays"]),
+            dtype=np.int8,
+            count=num_days
+        )
+        return _streak_from_bits(bits)
     
-    def _aggregate_languages(self, repositories: list[dict]) -> list[LanguageData]:
+    def _aggregate_languages(
+        self,
+        repositories: list[dict],
+        top_n: int = 3
+    ) -> list[LanguageData]:
         """
         Aggregate language usage across all repositories.
         
         Args:
             repositories: List of repository data with language edges.
+            top_n: Number of most-used languages to return.
             
         Returns:
-            Sorted list of languages by usage count.
+            Top languages sorted by usage count.
         """
-        language_totals: dict[str, dict] = {}
+        counts: dict[str, int] = {}
+        colors: dict[str, str] = {}
         
         for repo in repositories:
-            for edge in repo["languages"]["edges"]:
+            edges = repo["languages"]["edges"]
+            if not edges:
+                continue  # Forks, docs and empty repos report no languages
+            
+            for edge in edges:
                 name = edge["node"]["name"]
-                color = edge["node"]["color"] or "#858585"  # Default gray if no color
-                size = edge["size"]
-                
-                if name not in language_totals:
-                    language_totals[name] = {"name": name, "color": color, "usage_count": 0}
-                language_totals[name]["usage_count"] += size
-        
-        # Sort by usage count descending
-        sorted_languages = sorted(
-            language_totals.values(),
-            key=lambda x: x["usage_count"],
-            reverse=True
-        )
+                counts[name] = counts.get(name, 0) + edge["size"]
+                colors.setdefault(name, edge["node"]["color"] or "#858585")  # Default gray if no color
         
-        return [LanguageData(**lang) for lang in sorted_languages]
+        # Partial selection instead of a full sort; ties keep first-seen order
+        top = heapq.nlargest(top_n, counts.items(), key=itemgetter(1))
+        
+        return [
+            LanguageData(name=name, color=colors[name], usage_count=count)
+            for name, count in top
+        ]
     
-    def _fetch_commit_time_distribution(
+    def _calculate_commit_time_distribution(
         self, 
-        username: str, 
-        from_date: str, 
-        to_date: str
+        repositories: list[dict], 
+        username: str
     ) -> CommitTimeDistribution:
         """
-        Fetch commit time distribution by analyzing recent commits.
+        Calculate commit time distribution by analyzing recent commits.
         
         Note: This is an approximation based on available GraphQL data.
         For precise commit times, REST API would be needed per-repository.
         
         Args:
+            repositories: commitContributionsByRepository entries.
             username: GitHub username.
-            from_date: Start date ISO string.
-            to_date: End date ISO string.
             
         Returns:
             Distribution of commits across time periods.
         """
-        # GraphQL doesn't directly expose commit timestamps
-        # We'll use a heuristic based on contribution patterns
-        # For a production system, you'd iterate through repos and commits
-        
-        query = """
-        query($username: String!, $from: DateTime!, $to: DateTime!) {
-            user(login: $username) {
-                contributionsCollection(from: $from, to: $to) {
-                    commitContributionsByRepository(maxRepositories: 10) {
-                        repository {
-                            name
-                            defaultBranchRef {
-                                target {
-                                    ... on Commit {
-                                        history(first: 50) {
-                                            nodes {
-                                                committedDate
-                                                author {
-                                                    user {
-                                                        login
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
-        variables = {
-            "username": username,
-            "from": from_date,
-            "to": to_date
-        }
-        
-        distribution = CommitTimeDistribution(
-            morning=0,
-            afternoon=0,
-            evening=0,
-            night=0
-        )
+        username_lower = username.lower()
+        dates: list[str] = []
         
         try:
-            data = self._execute_query(query, variables)
-            repos = data["user"]["contributionsCollection"]["commitContributionsByRepository"]
-            
-            for repo_data in repos:
+            for repo_data in repositories:
                 branch_ref = repo_data["repository"].get("defaultBranchRef")
                 if not branch_ref or not branch_ref.get("target"):
                     continue
@@ -305,29 +436,26 @@ class GitHubDataLoader:
                 for commit in commits:
                     # Filter commits by the target user
                     author = commit.get("author", {}).get("user")
-                    if not author or author.get("login", "").lower() != username.lower():
+                    if not author or author.get("login", "").lower() != username_lower:
                         continue
                         
+                    # GitHub timestamps are always YYYY-MM-DDTHH:MM:SSZ (UTC)
                     committed_date = commit.get("committedDate", "")
-                    if not committed_date:
-                        continue
-                        
-                    # Parse hour from ISO timestamp
-                    try:
-                        dt = datetime.fromisoformat(committed_date.replace("Z", "+00:00"))
-                        hour = dt.hour
-                        
-                        if 6 <= hour < 12:
-                            distribution["morning"] += 1
-                        elif 12 <= hour < 18:
-                            distribution["afternoon"] += 1
-                        elif 18 <= hour < 24:
-                            distribution["evening"] += 1
-                        else:
-                            distribution["night"] += 1
-                    except (ValueError, AttributeError):
-                        continue
-                        
+                    if committed_date[11:13].isdigit():
+                        dates.append(committed_date)
+            
+            # Histogram all commit hours at once, then fold into 6-hour buckets
+            hours = np.fromiter((int(d[11:13]) for d in dates), dtype=np.int8, count=len(dates))
+            night, morning, afternoon, evening = (
+                np.bincount(hours, minlength=24)[:24].reshape(4, 6).sum(axis=1).tolist()
+            )
+            distribution = CommitTimeDistribution(
+                morning=morning,
+                afternoon=afternoon,
+                evening=evening,
+                night=night
+            )
+            
         except Exception:
             # If we can't get commit times, use default even distribution
             distribution = CommitTimeDistribution(
@@ -350,13 +478,18 @@ class GitHubDataLoader:
         return distribution
 
 
-def load_github_stats(username: str, token: Optional[str] = None) -> GitHubStats:
+def load_github_stats(
+    username: str,
+    token: Optional[str] = None,
+    use_cache: bool = True
+) -> GitHubStats:
     """
     Convenience function to load GitHub stats.
     
     Args:
         username: GitHub username to fetch stats for.
         token: Optional GitHub token. Falls back to GITHUB_TOKEN env var.
+        use_cache: Whether to reuse on-disk cached API responses.
         
     Returns:
         GitHubStats for aura generation.
@@ -373,5 +506,5 @@ def load_github_stats(username: str, token: Optional[str] = None) -> GitHubStats
             "or pass token parameter."
         )
     
-    loader = GitHubDataLoader(token)
+    loader = GitHubDataLoader(token, use_cache=use_cache)
     return loader.fetch_user_stats(username)
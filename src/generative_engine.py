@@ -4,11 +4,19 @@ Implements particle systems, vector flow fields, and noise functions
 for procedural aura generation.
 """
 
+import math
+
 import numpy as np
 from opensimplex import OpenSimplex
-from typing import NamedTuple
+from typing import NamedTuple, Union
 from dataclasses import dataclass, field
 
+from src.noise_core import build_permutation, noise2_batch
+
+
+# Scalar or array input accepted by the noise functions
+ArrayOrFloat = Union[float, np.ndarray]
+
 
 class Vector2D(NamedTuple):
     """2D Vector representation."""
@@ -22,7 +30,7 @@ class Vector2D(NamedTuple):
         return Vector2D(self.x * scalar, self.y * scalar)
     
     def magnitude(self) -> float:
-        return np.sqrt(self.x ** 2 + self.y ** 2)
+        return math.hypot(self.x, self.y)
     
     def normalize(self) -> "Vector2D":
         mag = self.magnitude()
@@ -51,11 +59,11 @@ class Particle:
         new_vx = self.velocity.x + acceleration.x
         new_vy = self.velocity.y + acceleration.y
         
-        # Clamp to max speed
-        speed = np.sqrt(new_vx ** 2 + new_vy ** 2)
-        if speed > max_speed:
-            new_vx = (new_vx / speed) * max_speed
-            new_vy = (new_vy / speed) * max_speed
+        # Clamp to max speed (branchless: scale is 1.0 when under the limit)
+        speed = math.hypot(new_vx, new_vy)
+        scale = min(1.0, max_speed / max(speed, 1e-12))
+        new_vx *= scale
+        new_vy *= scale
             
         self.velocity = Vector2D(new_vx, new_vy)
         
@@ -72,6 +80,10 @@ class NoiseGenerator:
     """
     Simplex noise generator for organic flow field creation.
     Uses OpenSimplex for smooth, natural-looking gradients.
+    
+    Scalar calls go through the opensimplex package; array inputs are
+    evaluated in one vectorized pass by src.noise_core, which produces
+    identical values.
     """
     
     def __init__(self, seed: int = 0):
@@ -83,21 +95,42 @@ class NoiseGenerator:
         """
         self.seed = seed
         self.noise = OpenSimplex(seed=seed)
+        self.perm = build_permutation(seed)
+        
+        # 1 / sum of octave amplitudes, keyed by (octaves, persistence)
+        self._inv_max: dict[tuple[int, float], float] = {}
         
-    def noise2d(self, x: float, y: float, scale: float = 0.01) -> float:
+    def noise2d(self, x: ArrayOrFloat, y: ArrayOrFloat, scale: float = 0.01) -> ArrayOrFloat:
         """
         Get 2D noise value at coordinates.
         
         Args:
-            x: X coordinate.
-            y: Y coordinate.
+            x: X coordinate, or array of X coordinates.
+            y: Y coordinate, or array of Y coordinates.
             scale: Noise frequency scale.
             
         Returns:
-            Noise value in range [-1, 1].
+            Noise value(s) in range [-1, 1].
         """
+        if isinstance(x, np.ndarray):
+            return noise2_batch(x * scale, y * scale, self.perm)
         return self.noise.noise2(x * scale, y * scale)
     
+    def noise2d_array(self, xs: np.ndarray, ys: np.ndarray, scale: float = 0.01) -> np.ndarray:
+        """
+        Get 2D noise over a grid in a single call.
+        
+        Args:
+            xs: 1-D array of X coordinates (grid columns).
+            ys: 1-D array of Y coordinates (grid rows).
+            scale: Noise frequency scale.
+            
+        Returns:
+            Array of shape (len(ys), len(xs)) with values in range [-1, 1].
+        """
+        grid_x, grid_y = np.meshgrid(np.asarray(xs) * scale, np.asarray(ys) * scale)
+        return noise2_batch(grid_x, grid_y, self.perm)
+    
     def noise3d(self, x: float, y: float, z: float, scale: float = 0.01) -> float:
         """
         Get 3D noise value (useful for animated noise).
@@ -113,21 +146,48 @@ class NoiseGenerator:
         """
         return self.noise.noise3(x * scale, y * scale, z * scale)
     
+    def noise3d_volume(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        ts: np.ndarray,
+        scale: float = 0.01
+    ) -> np.ndarray:
+        """
+        Evaluate 3D noise over a whole (t, y, x) grid in one call.
+        Use this instead of noise3d per point when sampling animation frames.
+        
+        Args:
+            xs: 1-D array of X coordinates.
+            ys: 1-D array of Y coordinates.
+            ts: 1-D array of Z coordinates (frame times).
+            scale: Noise frequency scale.
+            
+        Returns:
+            Array of shape (len(ts), len(ys), len(xs)) with noise values.
+        """
+        return self.noise.noise3array(
+            np.asarray(xs) * scale,
+            np.asarray(ys) * scale,
+            np.asarray(ts) * scale
+        )
+    
     def fractal_noise(
         self, 
-        x: float, 
-        y: float, 
+        x: ArrayOrFloat, 
+        y: ArrayOrFloat, 
         octaves: int = 4, 
         persistence: float = 0.5,
         scale: float = 0.01
-    ) -> float:
+    ) -> ArrayOrFloat:
         """
         Generate fractal Brownian motion noise (fBm).
         Combines multiple octaves for richer detail.
+        Arrays are evaluated in one batch per octave.
         
         Args:
-            x: X coordinate.
-            y: Y coordinate.
+            x: X coordinate, or array of X coordinates.
+            y: Y coordinate, or array of Y coordinates.
             octaves: Number of noise layers.
             persistence: Amplitude decay per octave.
             scale: Base frequency scale.
@@ -138,15 +198,64 @@ class NoiseGenerator:
         total = 0.0
         amplitude = 1.0
         frequency = 1.0
-        max_value = 0.0
         
         for _ in range(octaves):
             total += amplitude * self.noise2d(x * frequency, y * frequency, scale)
-            max_value += amplitude
             amplitude *= persistence
             frequency *= 2.0
             
-        return total / max_value
+        return total * self._fbm_normalizer(octaves, persistence)
+    
+    def _fbm_normalizer(self, octaves: int, persistence: float) -> float:
+        """
+        Get the factor that maps an fBm sum back into [-1, 1].
+        
+        The octave amplitudes form a geometric series, so their sum has a
+        closed form; it is computed once per (octaves, persistence).
+        
+        Args:
+            octaves: Number of noise layers.
+            persistence: Amplitude decay per octave.
+            
+        Returns:
+            Reciprocal of the summed amplitudes.
+        """
+        key = (octaves, persistence)
+        inv_max = self._inv_max.get(key)
+        if inv_max is None:
+            if persistence == 1.0:
+                inv_max = 1.0 / octaves
+            else:
+                inv_max = (1 - persistence) / (1 - persistence ** octaves)
+            self._inv_max[key] = inv_max
+        return inv_max
+    
+    def fractal_noise_array(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        octaves: int = 4,
+        persistence: float = 0.5,
+        scale: float = 0.01
+    ) -> np.ndarray:
+        """
+        Grid version of fractal_noise.
+        
+        Args:
+            xs: 1-D array of X coordinates (grid columns).
+            ys: 1-D array of Y coordinates (grid rows).
+            octaves: Number of noise layers.
+            persistence: Amplitude decay per octave.
+            scale: Base frequency scale.
+            
+        Returns:
+            Array of shape (len(ys), len(xs)) with combined noise values.
+        """
+        grid_x, grid_y = np.meshgrid(
+            np.asarray(xs, dtype=np.float64),
+            np.asarray(ys, dtype=np.float64)
+        )
+        return self.fractal_noise(grid_x, grid_y, octaves, persistence, scale)
 
 
 class VectorFlowField:
@@ -184,6 +293,15 @@ class VectorFlowField:
         self.cols = width // self.resolution
         self.rows = height // self.resolution
         
+        # Per-field constants, hoisted out of the force calculations
+        self._cx = width * 0.5
+        self._cy = height * 0.5
+        self._max_dist = math.hypot(self._cx, self._cy)
+        self._two_pi = 2 * math.pi
+        self._chaos_pi = chaos_factor * math.pi
+        self._chaos_active = chaos_factor > 0.3
+        self._turb_scale = noise_scale * 3
+        
     def get_force(self, x: float, y: float) -> Vector2D:
         """
         Get the force vector at a given position.
@@ -205,28 +323,57 @@ class VectorFlowField:
         
         # Map noise to angle (0 to 2*PI)
         # Higher chaos = more random angle variation
-        base_angle = noise_val * np.pi * 2
+        base_angle = noise_val * self._two_pi
         
         # Add secondary turbulence based on chaos factor
-        if self.chaos_factor > 0.3:
+        if self._chaos_active:
             turbulence = self.noise_gen.noise2d(
                 x * 2, y * 2, 
-                scale=self.noise_scale * 3
+                scale=self._turb_scale
             )
-            base_angle += turbulence * self.chaos_factor * np.pi
+            base_angle += turbulence * self._chaos_pi
         
         # Convert angle to vector
-        force_x = np.cos(base_angle)
-        force_y = np.sin(base_angle)
+        force_x = math.cos(base_angle)
+        force_y = math.sin(base_angle)
         
         # Scale force based on distance from center (creates spiral effect)
-        cx, cy = self.width / 2, self.height / 2
-        dist_from_center = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-        max_dist = np.sqrt(cx ** 2 + cy ** 2)
-        radial_factor = 1.0 - (dist_from_center / max_dist) * 0.5
+        dist_from_center = math.hypot(x - self._cx, y - self._cy)
+        radial_factor = 1.0 - (dist_from_center / self._max_dist) * 0.5
         
         return Vector2D(force_x * radial_factor, force_y * radial_factor)
     
+    def get_force_batch(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Get force vectors for many scattered positions at once.
+        
+        Args:
+            xs: 1-D array of X coordinates.
+            ys: 1-D array of Y coordinates.
+            
+        Returns:
+            Array of shape (N, 2) containing force vectors.
+        """
+        # Base angle from noise, all points in one batch per octave
+        noise_val = self.noise_gen.fractal_noise(
+            xs, ys,
+            octaves=3,
+            persistence=0.6,
+            scale=self.noise_scale
+        )
+        angle = noise_val
+        angle *= self._two_pi
+        
+        if self._chaos_active:
+            turbulence = self.noise_gen.noise2d(
+                xs * 2, ys * 2,
+                scale=self._turb_scale
+            )
+            turbulence *= self._chaos_pi
+            angle += turbulence
+        
+        return self._forces_from_angle(angle, np.hypot(xs - self._cx, ys - self._cy))
+    
     def get_force_grid(self) -> np.ndarray:
         """
         Generate the complete force field as a numpy array.
@@ -234,21 +381,65 @@ class VectorFlowField:
         Returns:
             Array of shape (rows, cols, 2) containing force vectors.
         """
-        grid = np.zeros((self.rows, self.cols, 2))
+        xs = np.arange(self.cols, dtype=np.float64) * self.resolution
+        ys = np.arange(self.rows, dtype=np.float64) * self.resolution
+        
+        # Same math as get_force, evaluated for every cell at once
+        noise_val = self.noise_gen.fractal_noise_array(
+            xs, ys,
+            octaves=3,
+            persistence=0.6,
+            scale=self.noise_scale
+        )
+        angle = noise_val
+        angle *= self._two_pi
+        
+        if self._chaos_active:
+            turbulence = self.noise_gen.noise2d_array(
+                xs * 2, ys * 2,
+                scale=self._turb_scale
+            )
+            turbulence *= self._chaos_pi
+            angle += turbulence
+        
+        # Distance grid via broadcasting instead of full meshgrid copies
+        dist = np.hypot((xs - self._cx)[None, :], (ys - self._cy)[:, None])
+        return self._forces_from_angle(angle, dist)
+    
+    def _forces_from_angle(self, angle: np.ndarray, dist: np.ndarray) -> np.ndarray:
+        """
+        Turn flow angles and center distances into force vectors.
         
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = col * self.resolution
-                y = row * self.resolution
-                force = self.get_force(x, y)
-                grid[row, col] = [force.x, force.y]
-                
-        return grid
+        Works in place on dist and writes cos/sin straight into the
+        output array, so no temporaries of the full field are allocated.
+        
+        Args:
+            angle: Flow angles (any shape).
+            dist: Distances from the center (same shape, overwritten).
+            
+        Returns:
+            Array of shape angle.shape + (2,) containing force vectors.
+        """
+        # Radial falloff from the center: 1 - (dist / max_dist) * 0.5
+        radial_factor = dist
+        radial_factor /= self._max_dist
+        radial_factor *= -0.5
+        radial_factor += 1.0
+        
+        forces = np.empty(angle.shape + (2,))
+        np.cos(angle, out=forces[..., 0])
+        np.sin(angle, out=forces[..., 1])
+        forces *= radial_factor[..., None]
+        return forces
 
 
 class ParticleSystem:
     """
     Particle system that simulates particles flowing through a vector field.
+    
+    Particle state is kept as structure-of-arrays: one (N, 2) array each for
+    positions and velocities, so every simulation step updates all
+    particles with a handful of NumPy operations.
     """
     
     def __init__(
@@ -267,122 +458,126 @@ class ParticleSystem:
         """
         self.flow_field = flow_field
         self.num_particles = int(num_particles * particle_density)
-        self.particles: list[Particle] = []
         self.width = flow_field.width
         self.height = flow_field.height
         
+        # Single precision is plenty for pixel coordinates and halves memory traffic
+        self.positions = np.empty((self.num_particles, 2), dtype=np.float32)
+        self.velocities = np.zeros((self.num_particles, 2), dtype=np.float32)
+        self.opacities = np.empty(self.num_particles)
+        self.path_buf = np.empty((self.num_particles, 0, 2), dtype=np.float32)
+        
         self._initialize_particles()
         
     def _initialize_particles(self) -> None:
         """Initialize particles in organic distribution around center."""
+        n = self.num_particles
         cx, cy = self.width / 2, self.height / 2
+        max_r = min(self.width, self.height) * 0.35
         
         # Use golden angle for organic spiral distribution
-        golden_angle = np.pi * (3 - np.sqrt(5))
+        golden_angle = math.pi * (3 - math.sqrt(5))
         
-        for i in range(self.num_particles):
-            # Fibonacci spiral distribution
-            theta = i * golden_angle
-            # Radius grows with sqrt for uniform density
-            r = np.sqrt(i / self.num_particles) * min(self.width, self.height) * 0.35
-            
-            x = cx + r * np.cos(theta)
-            y = cy + r * np.sin(theta)
-            
-            # Add slight randomness
-            x += np.random.uniform(-5, 5)
-            y += np.random.uniform(-5, 5)
-            
-            # Opacity based on distance from center
-            max_r = min(self.width, self.height) * 0.35
-            opacity = 0.3 + 0.7 * (1 - r / max_r)
-            
-            self.particles.append(Particle(
-                position=Vector2D(x, y),
-                opacity=opacity
-            ))
+        # Fibonacci spiral distribution; radius grows with sqrt for uniform density
+        i = np.arange(n)
+        theta = i * golden_angle
+        r = np.sqrt(i / n) * max_r
+        
+        # Slight randomness, drawn in one call (same per-particle x, y order)
+        jitter = np.random.uniform(-5, 5, size=(n, 2))
+        
+        self.positions[:, 0] = cx + r * np.cos(theta) + jitter[:, 0]
+        self.positions[:, 1] = cy + r * np.sin(theta) + jitter[:, 1]
+        
+        # Opacity based on distance from center
+        self.opacities[:] = 0.3 + 0.7 * (1 - r / max_r)
     
-    def simulate(self, steps: int = 100, force_scale: float = 0.5) -> list[Particle]:
+    def simulate(
+        self,
+        steps: int = 100,
+        force_scale: float = 0.5,
+        stride: int = 1
+    ) -> np.ndarray:
         """
         Run particle simulation for given number of steps.
         
         Args:
             steps: Number of simulation steps.
             force_scale: Multiplier for force application.
+            stride: Record every stride-th position (1 keeps every step).
+                The final position is always recorded as well.
             
         Returns:
-            List of particles with updated paths.
+            Array of shape (N, points, 2) with every particle's path.
         """
+        if stride < 1:
+            raise ValueError(f"stride must be at least 1, got {stride}")
+        
+        max_speed = 3.0
+        margin = 10
+        pos = self.positions
+        vel = self.velocities
+        
+        # Wrapped extent per axis, including the margin on both sides
+        span = np.array([self.width + 2 * margin, self.height + 2 * margin], dtype=np.float32)
+        
+        # Step count is known up front, so record into a preallocated buffer
+        num_recorded = (steps + stride - 1) // stride
+        record_last = steps > 0 and (steps - 1) % stride != 0
+        num_recorded += record_last
+        path_buf = np.empty((self.num_particles, num_recorded, 2), dtype=np.float32)
+        
         for step in range(steps):
-            for particle in self.particles:
-                # Get force from flow field
-                force = self.flow_field.get_force(
-                    particle.position.x, 
-                    particle.position.y
-                )
-                
-                # Scale force
-                scaled_force = Vector2D(
-                    force.x * force_scale,
-                    force.y * force_scale
-                )
-                
-                # Update particle
-                particle.update(scaled_force, max_speed=3.0)
-                
-                # Wrap around edges with slight margin
-                margin = 10
-                if particle.position.x < -margin:
-                    particle.position = Vector2D(
-                        self.width + margin, 
-                        particle.position.y
-                    )
-                elif particle.position.x > self.width + margin:
-                    particle.position = Vector2D(
-                        -margin, 
-                        particle.position.y
-                    )
-                    
-                if particle.position.y < -margin:
-                    particle.position = Vector2D(
-                        particle.position.x, 
-                        self.height + margin
-                    )
-                elif particle.position.y > self.height + margin:
-                    particle.position = Vector2D(
-                        particle.position.x, 
-                        -margin
-                    )
+            # Exact forces for all particles in one batch (float64 for the noise)
+            coords = pos.astype(np.float64)
+            force = self.flow_field.get_force_batch(coords[:, 0], coords[:, 1])
+            vel += force * force_scale
+            
+            # Clamp to max speed without a masked scatter
+            speed = np.hypot(vel[:, 0], vel[:, 1])
+            np.maximum(speed, 1e-12, out=speed)
+            scale = np.minimum(1.0, max_speed / speed)
+            vel *= scale[:, None]
+            
+            # Record position, then move
+            if step % stride == 0:
+                path_buf[:, step // stride] = pos
+            elif record_last and step == steps - 1:
+                path_buf[:, -1] = pos
+            pos += vel
+            
+            # Wrap around edges with slight margin
+            pos += margin
+            np.mod(pos, span, out=pos)
+            pos -= margin
+        
+        # Repeated calls extend the existing paths
+        if self.path_buf.shape[1]:
+            path_buf = np.concatenate([self.path_buf, path_buf], axis=1)
+        self.path_buf = path_buf
                     
-        return self.particles
+        return self.path_buf
     
-    def get_paths(self) -> list[list[tuple[float, float]]]:
+    def get_paths(self) -> list[np.ndarray]:
         """
-        Extract all particle paths as coordinate lists.
+        Extract all particle paths.
         
         Returns:
-            List of paths, each path is a list of (x, y) tuples.
-        """
-        paths = []
-        for particle in self.particles:
-            if len(particle.path) > 2:
-                path = [(p.x, p.y) for p in particle.path]
-                paths.append(path)
-        return paths
+            List of (steps, 2) arrays, one view into the path buffer per
+            particle, or an empty list if paths are too short to draw.
+        """
+        if self.path_buf.shape[1] <= 2:
+            return []
+        return list(self.path_buf)
     
-    def get_paths_with_opacity(self) -> list[tuple[list[tuple[float, float]], float]]:
+    def get_paths_with_opacity(self) -> list[tuple[np.ndarray, float]]:
         """
         Extract paths with their opacity values.
         
         Returns:
             List of (path, opacity) tuples.
         """
-        paths = []
-        for particle in self.particles:
-            if len(particle.path) > 2:
-                path = [(p.x, p.y) for p in particle.path]
-                paths.append((path, particle.opacity))
-        return paths
+        return list(zip(self.get_paths(), self.opacities.tolist()))
 
 
 class AuraGenerator:
@@ -414,8 +609,9 @@ class AuraGenerator:
         self,
         density: float,
         chaos_factor: float,
-        simulation_steps: int = 150
-    ) -> list[tuple[list[tuple[float, float]], float]]:
+        simulation_steps: int = 150,
+        path_stride: int = 1
+    ) -> list[tuple[np.ndarray, float]]:
         """
         Generate aura particle paths.
         
@@ -423,6 +619,10 @@ class AuraGenerator:
             density: Normalized commit density (0-1 from log scale).
             chaos_factor: Normalized chaos factor (0-1 from time variance).
             simulation_steps: Number of simulation iterations.
+            path_stride: Keep every path_stride-th point of each path (plus
+                the last). Stroke widths are derived from path length, so
+                pass simulation_steps to the renderer as path_steps to keep
+                them unchanged.
             
         Returns:
             List of (path, opacity) tuples for rendering.
@@ -451,7 +651,8 @@ class AuraGenerator:
         
         particle_system.simulate(
             steps=simulation_steps,
-            force_scale=0.3 + chaos_factor * 0.4
+            force_scale=0.3 + chaos_factor * 0.4,
+            stride=path_stride
         )
         
         return particle_system.get_paths_with_opacity()
@@ -3,17 +3,96 @@ Git-Aura: SVG Renderer Module
 Handles SVG generation, color mathematics, and visual effects.
 """
 
+import io
+import gzip
+import functools
 import numpy as np
 import svgwrite
 from svgwrite import Drawing
 from svgwrite.container import Group
-from typing import Optional
+from typing import Optional, Union
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 
 
-@dataclass
+# Particle path: (N, 2) float32 coordinate array, as the generative engine
+# produces; lists of (x, y) tuples are accepted and converted
+PathPoints = Union[np.ndarray, list[tuple[float, float]]]
+
+# Particle path element, attributes in the order svgwrite serializes them
+_PATH_TEMPLATE = (
+    '<path d="{d}" fill="none" stroke="{stroke}" stroke-linecap="round" '
+    'stroke-linejoin="round" stroke-opacity="{opacity}" stroke-width="{width}" />'
+)
+
+# Short paths (no curve segments worth drawing) as a plain polyline
+_POLYLINE_TEMPLATE = (
+    '<polyline fill="none" points="{points}" stroke="{stroke}" stroke-linecap="round" '
+    'stroke-linejoin="round" stroke-opacity="{opacity}" stroke-width="{width}" />'
+)
+_MAX_POLYLINE_POINTS = 3
+
+# Gradient stops and glow filter primitives, formatted like svgwrite would
+_STOP_TEMPLATE = '<stop offset="{offset}" stop-color="{color}" />'
+_STOP_OPACITY_TEMPLATE = (
+    '<stop offset="{offset}" stop-color="{color}" stop-opacity="{opacity}" />'
+)
+_GLOW_FILTER_TEMPLATE = (
+    '<feGaussianBlur in="SourceGraphic" result="blur" stdDeviation="{blur}" />'
+    # Color matrix to tint the blur: 20 values for a 5x4 matrix
+    # (RGBA + offset for each channel)
+    '<feColorMatrix in="blur" result="coloredBlur" type="matrix" '
+    'values="{r:.4f} 0 0 0 0 0 {g:.4f} 0 0 0 0 0 {b:.4f} 0 0 0 0 0 1 0" />'
+    # Merge original with blur
+    '<feMerge><feMergeNode in="coloredBlur" /><feMergeNode in="SourceGraphic" /></feMerge>'
+)
+
+# Fixed CSS for the pulsing animation, identical for every aura
+_ANIMATION_CSS = """
+@keyframes pulse {
+    0%, 100% { opacity: 0.8; }
+    50% { opacity: 1; }
+}
+@keyframes rotate {
+    from { transform: rotate(0deg); }
+    to { transform: rotate(360deg); }
+}
+#aura-paths {
+    animation: pulse 4s ease-in-out infinite;
+    transform-origin: center;
+}
+"""
+
+# Byte value (0-255) to channel float, so hex parsing never divides
+_HEX_LUT = tuple(i / 255.0 for i in range(256))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_hex(hex_color: str) -> tuple[float, float, float]:
+    """
+    Parse a hex color into (r, g, b) floats, memoized per string.
+    
+    Args:
+        hex_color: Hex color like '#FF5733' or 'FF5733'.
+        
+    Returns:
+        Channel values in range [0, 1]; gray if the string is invalid.
+    """
+    digits = hex_color[1:] if hex_color.startswith("#") else hex_color
+    try:
+        # Decode all three channels in one C call
+        r, g, b = bytes.fromhex(digits)
+    except ValueError:
+        # Default to gray if invalid
+        return (0.5, 0.5, 0.5)
+    
+    return (_HEX_LUT[r], _HEX_LUT[g], _HEX_LUT[b])
+
+
+@dataclass(frozen=True)
 class ColorRGB:
-    """RGB color representation with float components (0-1)."""
+    """RGB color representation with float components (0-1). Immutable."""
     r: float
     g: float
     b: float
@@ -29,28 +108,31 @@ class ColorRGB:
         Returns:
             ColorRGB instance.
         """
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) != 6:
-            # Default to gray if invalid
-            return cls(0.5, 0.5, 0.5)
-        
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return cls(r, g, b)
+        return cls(*_parse_hex(hex_color))
+    
+    @cached_property
+    def _bytes(self) -> tuple[int, int, int]:
+        """Channels as 0-255 ints, computed once per (immutable) color."""
+        # Plain min/max: np.clip on a Python float costs far more than the math
+        return (
+            int(min(max(self.r * 255, 0.0), 255.0)),
+            int(min(max(self.g * 255, 0.0), 255.0)),
+            int(min(max(self.b * 255, 0.0), 255.0))
+        )
+    
+    @cached_property
+    def _hex(self) -> str:
+        """Hex string, computed once per color."""
+        r, g, b = self._bytes
+        return f"#{r:02x}{g:02x}{b:02x}"
     
     def to_hex(self) -> str:
         """Convert to hex string."""
-        r = int(np.clip(self.r * 255, 0, 255))
-        g = int(np.clip(self.g * 255, 0, 255))
-        b = int(np.clip(self.b * 255, 0, 255))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return self._hex
     
     def to_rgb_string(self, alpha: float = 1.0) -> str:
         """Convert to CSS rgba string."""
-        r = int(np.clip(self.r * 255, 0, 255))
-        g = int(np.clip(self.g * 255, 0, 255))
-        b = int(np.clip(self.b * 255, 0, 255))
+        r, g, b = self._bytes
         return f"rgba({r},{g},{b},{alpha:.2f})"
     
     def blend(self, other: "ColorRGB", weight: float) -> "ColorRGB":
@@ -81,10 +163,192 @@ class ColorRGB:
         return self.blend(black, amount)
 
 
+# Defs content depends only on colors and intensity (ids live on the parent
+# elements), so identical palettes reuse the formatted markup
+
+@functools.lru_cache(maxsize=64)
+def _glow_filter_markup(blur: float, r: float, g: float, b: float) -> str:
+    """Children of the glow filter: blur, color tint, merge."""
+    return _GLOW_FILTER_TEMPLATE.format(blur=blur, r=r, g=g, b=b)
+
+
+@functools.lru_cache(maxsize=64)
+def _gradient_stops_markup(colors_hex: tuple[str, ...]) -> str:
+    """Evenly spaced gradient stops for the given colors."""
+    last = len(colors_hex) - 1
+    return "".join(
+        _STOP_TEMPLATE.format(offset=i / last if last > 0 else 0, color=color)
+        for i, color in enumerate(colors_hex)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _fading_stops_markup(color_hex: str, intensity: float) -> str:
+    """Center glow stops, fading the color out to transparent."""
+    return "".join(
+        _STOP_OPACITY_TEMPLATE.format(offset=offset, color=color_hex, opacity=opacity)
+        for offset, opacity in ((0, 0.3 * intensity), (0.5, 0.1 * intensity), (1, 0))
+    )
+
+
+def palette_to_array(palette: list[ColorRGB]) -> np.ndarray:
+    """
+    Pack colors into an (N, 3) array of r, g, b channels.
+    
+    Args:
+        palette: Colors to pack.
+        
+    Returns:
+        Array of shape (N, 3).
+    """
+    channels = [(color.r, color.g, color.b) for color in palette]
+    return np.array(channels, dtype=np.float64).reshape(-1, 3)
+
+
+def blend_rgb(
+    colors: np.ndarray,
+    other: Union[float, np.ndarray],
+    weight: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Vectorized ColorRGB.blend over an (N, 3) color array.
+    
+    Args:
+        colors: Array of shape (N, 3).
+        other: Color(s) to blend toward, broadcastable to colors.
+        weight: Weight for other, scalar or shape (N, 1).
+        
+    Returns:
+        Blended colors, shape (N, 3).
+    """
+    return colors * (1 - weight) + other * weight
+
+
+def rgb_array_to_hex(colors: np.ndarray) -> list[str]:
+    """
+    Vectorized ColorRGB.to_hex for an (N, 3) color array.
+    
+    Args:
+        colors: Array of shape (N, 3) with channels in [0, 1].
+        
+    Returns:
+        List of N '#rrggbb' strings.
+    """
+    channels = np.clip(colors * 255, 0, 255).astype(np.uint8)
+    # One C-level hex encoding for every color, then 6-char slices
+    hex_blob = channels.tobytes().hex()
+    return ["#" + hex_blob[i:i + 6] for i in range(0, len(hex_blob), 6)]
+
+
+def hue_rotation_matrix(degrees: float) -> np.ndarray:
+    """
+    Build the 3x3 matrix that rotates RGB colors about the gray axis.
+    
+    Args:
+        degrees: Hue rotation angle.
+        
+    Returns:
+        Array of shape (3, 3); apply as matrix @ [r, g, b].
+    """
+    theta = np.radians(degrees)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    # Rodrigues' rotation about the unit vector (1, 1, 1) / sqrt(3)
+    cross = np.array([[0, -1, 1], [1, 0, -1], [-1, 1, 0]]) / np.sqrt(3)
+    return cos_t * np.eye(3) + (1 - cos_t) / 3 * np.ones((3, 3)) + sin_t * cross
+
+
+# sRGB (D65) <-> CIE XYZ, and the D65 reference white
+_SRGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_XYZ_TO_SRGB = np.linalg.inv(_SRGB_TO_XYZ)
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+_LAB_DELTA = 6 / 29
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB colors to CIE L*a*b*.
+    
+    Args:
+        rgb: Array of shape (N, 3) with channels in [0, 1].
+        
+    Returns:
+        Array of shape (N, 3) with L in [0, 100].
+    """
+    rgb = np.clip(rgb, 0.0, 1.0)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _SRGB_TO_XYZ.T / _D65_WHITE
+    
+    f = np.where(
+        xyz > _LAB_DELTA ** 3,
+        np.cbrt(xyz),
+        xyz / (3 * _LAB_DELTA ** 2) + 4 / 29
+    )
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2])
+    ], axis=-1)
+
+
+def lab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert CIE L*a*b* colors back to sRGB, clipped to the gamut.
+    
+    Args:
+        lab: Array of shape (N, 3).
+        
+    Returns:
+        Array of shape (N, 3) with channels in [0, 1].
+    """
+    fy = (lab[:, 0] + 16) / 116
+    f = np.stack([fy + lab[:, 1] / 500, fy, fy - lab[:, 2] / 200], axis=-1)
+    xyz = np.where(
+        f > _LAB_DELTA,
+        f ** 3,
+        3 * _LAB_DELTA ** 2 * (f - 4 / 29)
+    ) * _D65_WHITE
+    
+    linear = np.clip(xyz @ _XYZ_TO_SRGB.T, 0.0, 1.0)
+    return np.where(
+        linear <= 0.0031308,
+        linear * 12.92,
+        1.055 * linear ** (1 / 2.4) - 0.055
+    )
+
+
+def shift_lightness(lab: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+    """
+    Lighten (amount > 0) or darken (amount < 0) Lab colors.
+    
+    Moves L toward 100 or 0 by the given fraction, the perceptual
+    counterpart of ColorRGB.lighten/darken.
+    
+    Args:
+        lab: Array of shape (N, 3).
+        amounts: Array of shape (N,) with fractions in [-1, 1].
+        
+    Returns:
+        Adjusted copy of lab.
+    """
+    shifted = lab.copy()
+    lightness = lab[:, 0]
+    shifted[:, 0] = np.where(
+        amounts >= 0,
+        lightness + (100 - lightness) * amounts,
+        lightness * (1 + amounts)
+    )
+    return shifted
+
+
 class ColorPaletteGenerator:
     """
     Generates color palettes from language statistics.
-    Uses weighted averaging in LAB color space for perceptually uniform blending.
+    Lighter and darker variants are derived in L*a*b* space so the
+    lightness steps look even across hues.
     """
     
     # Dark mode friendly background
@@ -93,6 +357,12 @@ class ColorPaletteGenerator:
     # Fallback colors if no language data
     DEFAULT_COLORS = ["#58a6ff", "#8b5cf6", "#f97316"]
     
+    # Triadic hue shift for the accent color
+    HUE_ROTATION = hue_rotation_matrix(240.0)
+    
+    # Lightness shifts for the lighter base, darker base and lighter accent
+    LIGHTNESS_SHIFTS = np.array([0.3, -0.2, 0.2])
+    
     def __init__(self, languages: list[dict]):
         """
         Initialize palette generator.
@@ -112,22 +382,16 @@ class ColorPaletteGenerator:
         if not self.languages:
             return ColorRGB.from_hex(self.DEFAULT_COLORS[0])
         
-        total_usage = sum(lang.get("usage_count", 1) for lang in self.languages[:3])
+        top = self.languages[:3]
+        colors = np.array([_parse_hex(lang.get("color", "#858585")) for lang in top])
+        weights = np.array([lang.get("usage_count", 1) for lang in top], dtype=np.float64)
+        
+        total_usage = weights.sum()
         if total_usage == 0:
             total_usage = 1
             
         # Weighted color averaging
-        r_sum, g_sum, b_sum = 0.0, 0.0, 0.0
-        
-        for lang in self.languages[:3]:
-            color = ColorRGB.from_hex(lang.get("color", "#858585"))
-            weight = lang.get("usage_count", 1) / total_usage
-            
-            r_sum += color.r * weight
-            g_sum += color.g * weight
-            b_sum += color.b * weight
-            
-        return ColorRGB(r_sum, g_sum, b_sum)
+        return ColorRGB(*(weights / total_usage @ colors).tolist())
     
     def generate_palette(self, num_colors: int = 5) -> list[ColorRGB]:
         """
@@ -140,25 +404,24 @@ class ColorPaletteGenerator:
             List of ColorRGB colors.
         """
         base = self.calculate_base_color()
-        palette = [base]
-        
-        # Add lighter and darker variants
-        palette.append(base.lighten(0.3))
-        palette.append(base.darken(0.2))
-        
-        # Add complementary-ish colors by rotating hue
-        # Simple approximation: shift RGB channels
-        if num_colors > 3:
-            shifted = ColorRGB(
-                r=base.g * 0.7 + base.r * 0.3,
-                g=base.b * 0.7 + base.g * 0.3,
-                b=base.r * 0.7 + base.b * 0.3
-            )
-            palette.append(shifted)
-            
-        if num_colors > 4:
-            palette.append(shifted.lighten(0.2))
-            
+        base_rgb = np.array([base.r, base.g, base.b])
+        
+        # Accent color by rotating hue about the gray axis
+        accent_rgb = np.clip(self.HUE_ROTATION @ base_rgb, 0.0, 1.0)
+        
+        # Lighter and darker variants, shifted in Lab in one batch
+        sources = np.stack([base_rgb, base_rgb, accent_rgb])
+        lighter, darker, accent_light = lab_to_rgb(
+            shift_lightness(rgb_to_lab(sources), self.LIGHTNESS_SHIFTS)
+        ).tolist()
+        
+        palette = [
+            base,
+            ColorRGB(*lighter),
+            ColorRGB(*darker),
+            ColorRGB(*accent_rgb.tolist()),
+            ColorRGB(*accent_light)
+        ]
         return palette[:num_colors]
 
 
@@ -186,6 +449,14 @@ class SVGRenderer:
         self.background_color = background_color
         self.dwg: Optional[Drawing] = None
         
+        # Content of hot or repetitive elements is kept as plain markup and
+        # spliced into the serialized document, bypassing svgwrite's
+        # per-element objects: (empty element markup, filled markup)
+        self._splices: list[tuple[str, str]] = []
+        
+        # (container, element) pairs added by render_paths, for reset()
+        self._path_layer: list[tuple] = []
+        
     def create_drawing(self, filename: str = "aura.svg") -> Drawing:
         """
         Create new SVG drawing with dark background.
@@ -196,10 +467,13 @@ class SVGRenderer:
         Returns:
             svgwrite Drawing object.
         """
+        # debug=False skips svgwrite's per-attribute validation; every
+        # element here is built from fixed, known-valid attributes
         self.dwg = svgwrite.Drawing(
             filename,
             size=(f"{self.width}px", f"{self.height}px"),
-            viewBox=f"0 0 {self.width} {self.height}"
+            viewBox=f"0 0 {self.width} {self.height}",
+            debug=False
         )
         
         # Add background
@@ -209,14 +483,35 @@ class SVGRenderer:
             fill=self.background_color
         ))
         
+        self._splices = []
+        self._path_layer = []
+        
         return self.dwg
     
+    def _fill_element(self, element, content: str) -> None:
+        """
+        Give an element raw child markup, inserted when serializing.
+        
+        The element must already be in the drawing, empty, with an id (or
+        other attributes) that make its serialized form unique.
+        
+        Args:
+            element: svgwrite element to fill.
+            content: Child markup.
+        """
+        if not content:
+            return
+        placeholder = element.tostring()
+        # "<tag ... />" becomes "<tag ...>content</tag>"
+        filled = f"{placeholder[:-3]}>{content}</{element.elementname}>"
+        self._splices.append((placeholder, filled))
+    
     def add_glow_filter(
         self, 
         filter_id: str, 
         intensity: float, 
         color: ColorRGB
-    ) -> None:
+    ) -> svgwrite.filters.Filter:
         """
         Add Gaussian blur glow filter.
         
@@ -224,6 +519,9 @@ class SVGRenderer:
             filter_id: Unique filter ID.
             intensity: Blur intensity (maps to stdDeviation).
             color: Glow color.
+            
+        Returns:
+            The svgwrite filter element.
         """
         if self.dwg is None:
             raise ValueError("Drawing not initialized. Call create_drawing first.")
@@ -238,30 +536,12 @@ class SVGRenderer:
             width="200%", height="200%"
         ))
         
-        # Gaussian blur
-        glow_filter.feGaussianBlur(
-            in_="SourceGraphic",
-            stdDeviation=blur_radius,
-            result="blur"
-        )
-        
-        # Color matrix to tint the blur
-        # Format: 20 values for 5x4 matrix (RGBA + offset for each channel)
-        matrix_values = (
-            f"{color.r:.4f} 0 0 0 0 "
-            f"0 {color.g:.4f} 0 0 0 "
-            f"0 0 {color.b:.4f} 0 0 "
-            f"0 0 0 1 0"
+        # Gaussian blur tinted with the glow color, merged over the source
+        self._fill_element(
+            glow_filter,
+            _glow_filter_markup(blur_radius, color.r, color.g, color.b)
         )
-        glow_filter.feColorMatrix(
-            in_="blur",
-            type="matrix",
-            values=matrix_values,
-            result="coloredBlur"
-        )
-        
-        # Merge original with blur using feMerge with layernames
-        glow_filter.feMerge(layernames=["coloredBlur", "SourceGraphic"])
+        return glow_filter
     
     def add_gradient(
         self,
@@ -294,22 +574,18 @@ class SVGRenderer:
             )
         
         # Add color stops
-        for i, color in enumerate(colors):
-            offset = i / (len(colors) - 1) if len(colors) > 1 else 0
-            gradient.add_stop_color(
-                offset=offset,
-                color=color.to_hex()
-            )
-            
+        stops = _gradient_stops_markup(tuple(color.to_hex() for color in colors))
+        
         self.dwg.defs.add(gradient)
+        self._fill_element(gradient, stops)
     
-    def path_to_svg_d(self, path: list[tuple[float, float]]) -> str:
+    def path_to_svg_d(self, path: PathPoints) -> str:
         """
         Convert path coordinates to SVG path 'd' attribute.
         Uses quadratic bezier curves for smooth lines.
         
         Args:
-            path: List of (x, y) coordinates.
+            path: (N, 2) array or list of (x, y) coordinates.
             
         Returns:
             SVG path 'd' string.
@@ -317,39 +593,34 @@ class SVGRenderer:
         if len(path) < 2:
             return ""
         
-        # Start with move to first point
-        d = f"M {path[0][0]:.2f} {path[0][1]:.2f}"
+        # float64 keeps midpoints identical to plain Python float math
+        pts = np.asarray(path, dtype=np.float64)
+        
+        # Move to first point, then line to the second
+        d = "M %.2f %.2f L %.2f %.2f" % tuple(pts[:2].ravel().tolist())
         
-        if len(path) == 2:
+        if len(pts) == 2:
             # Simple line
-            d += f" L {path[1][0]:.2f} {path[1][1]:.2f}"
             return d
         
-        # Use smooth quadratic bezier through points
-        # Start with line to second point
-        d += f" L {path[1][0]:.2f} {path[1][1]:.2f}"
-        
-        # Quadratic bezier through remaining points
-        for i in range(2, len(path)):
-            # Control point is the previous point
-            # End point is midpoint to next (or current for last)
-            if i < len(path) - 1:
-                end_x = (path[i][0] + path[i + 1][0]) / 2
-                end_y = (path[i][1] + path[i + 1][1]) / 2
-            else:
-                end_x = path[i][0]
-                end_y = path[i][1]
-                
-            d += f" Q {path[i - 1][0]:.2f} {path[i - 1][1]:.2f} {end_x:.2f} {end_y:.2f}"
-        
-        return d
+        # Quadratic bezier through remaining points: the control point is the
+        # previous point, the end point is the midpoint to the next point
+        # (or the point itself for the last segment)
+        ends = pts[2:].copy()
+        ends[:-1] = (pts[2:-1] + pts[3:]) / 2
+        segments = np.concatenate([pts[1:-1], ends], axis=1)
+        
+        # One format call for the whole path instead of one per segment
+        template = " Q %.2f %.2f %.2f %.2f" * len(segments)
+        return d + template % tuple(segments.ravel().tolist())
     
     def render_paths(
         self,
-        paths_with_opacity: list[tuple[list[tuple[float, float]], float]],
+        paths_with_opacity: list[tuple[PathPoints, float]],
         palette: list[ColorRGB],
         glow_intensity: float = 0.5,
-        stroke_width_base: float = 1.5
+        stroke_width_base: float = 1.5,
+        path_steps: Optional[int] = None
     ) -> None:
         """
         Render particle paths to the SVG.
@@ -359,13 +630,15 @@ class SVGRenderer:
             palette: Color palette for strokes.
             glow_intensity: Intensity of glow effect.
             stroke_width_base: Base stroke width.
+            path_steps: Simulation steps each path spans, used instead of
+                the point count for stroke widths of strided paths.
         """
         if self.dwg is None:
             raise ValueError("Drawing not initialized.")
         
         # Add glow filter
         primary_color = palette[0] if palette else ColorRGB(0.5, 0.7, 1.0)
-        self.add_glow_filter("aura-glow", glow_intensity, primary_color)
+        glow_filter = self.add_glow_filter("aura-glow", glow_intensity, primary_color)
         
         # Create group for all paths
         paths_group = self.dwg.g(
@@ -373,39 +646,89 @@ class SVGRenderer:
             filter="url(#aura-glow)"
         )
         
+        # Per-path styling computed for all paths at once, so the loop
+        # below only builds elements
+        num_paths = len(paths_with_opacity)
+        
+        # Palette color per path with slight variation for visual interest
+        palette_rgb = palette_to_array(palette)
+        path_colors = palette_rgb[np.arange(num_paths) % len(palette)]
+        variations = (np.sin(np.arange(num_paths) * 0.1) * 0.1)[:, None]
+        
+        # Lighten toward white for positive variation, darken toward black
+        # for negative: one blend instead of a lighten/darken chain
+        targets = (variations > 0).astype(np.float64)
+        varied_rgb = blend_rgb(path_colors, targets, np.abs(variations))
+        stroke_colors = rgb_array_to_hex(varied_rgb)
+        
+        # Paths as (N, 2) arrays; engine arrays pass through uncopied, lists
+        # become float64 so their coordinates are not rounded before formatting
+        paths = [
+            (path if isinstance(path, np.ndarray) else np.asarray(path, dtype=np.float64)).reshape(-1, 2)
+            for path, _ in paths_with_opacity
+        ]
+        
+        # Stroke width grows with path length, capped at 3
+        if path_steps is not None:
+            path_lengths = np.full(num_paths, path_steps, dtype=np.int64)
+        else:
+            path_lengths = np.fromiter(
+                (len(path) for path in paths),
+                dtype=np.int64,
+                count=num_paths
+            )
+        stroke_widths = np.minimum(
+            stroke_width_base * (0.5 + (path_lengths / 200)), 3.0
+        ).tolist()
+        stroke_opacities = [opacity * 0.8 for _, opacity in paths_with_opacity]
+        
         # Render each path
-        for i, (path, opacity) in enumerate(paths_with_opacity):
+        path_strings = []
+        for i, path in enumerate(paths):
             if len(path) < 2:
                 continue
-                
-            # Select color from palette with variation
-            color_idx = i % len(palette)
-            color = palette[color_idx]
-            
-            # Slight color variation for visual interest
-            variation = np.sin(i * 0.1) * 0.1
-            varied_color = color.lighten(max(0, variation)).darken(max(0, -variation))
             
-            # Calculate stroke width based on path length
-            path_length = len(path)
-            stroke_width = stroke_width_base * (0.5 + (path_length / 200))
-            stroke_width = min(stroke_width, 3.0)
+            if len(path) <= _MAX_POLYLINE_POINTS:
+                # With at most three points the single bezier segment has its
+                # control point on the line, so a polyline draws the same shape
+                points = " ".join("%.2f,%.2f" % (x, y) for x, y in path.tolist())
+                path_strings.append(_POLYLINE_TEMPLATE.format(
+                    points=points,
+                    stroke=stroke_colors[i],
+                    opacity=stroke_opacities[i],
+                    width=stroke_widths[i]
+                ))
+                continue
             
-            # Create path element
+            # Emit path element markup directly
             d = self.path_to_svg_d(path)
             if d:
-                path_elem = self.dwg.path(
+                path_strings.append(_PATH_TEMPLATE.format(
                     d=d,
-                    stroke=varied_color.to_hex(),
-                    stroke_width=stroke_width,
-                    stroke_opacity=opacity * 0.8,
-                    fill="none",
-                    stroke_linecap="round",
-                    stroke_linejoin="round"
-                )
-                paths_group.add(path_elem)
+                    stroke=stroke_colors[i],
+                    opacity=stroke_opacities[i],
+                    width=stroke_widths[i]
+                ))
         
         self.dwg.add(paths_group)
+        self._fill_element(paths_group, "".join(path_strings))
+        self._path_layer = [(self.dwg.defs, glow_filter), (self.dwg, paths_group)]
+    
+    def reset(self) -> None:
+        """
+        Remove the rendered paths and their glow filter from the drawing.
+        
+        The background, center glow, animation and other defs are kept,
+        so render_paths can be called again to render another aura
+        without rebuilding the drawing.
+        """
+        for container, element in self._path_layer:
+            placeholder = element.tostring()
+            container.elements.remove(element)
+            self._splices = [
+                splice for splice in self._splices if splice[0] != placeholder
+            ]
+        self._path_layer = []
     
     def add_center_glow(
         self,
@@ -434,11 +757,10 @@ class SVGRenderer:
         )
         
         # Gradient from color to transparent
-        gradient.add_stop_color(0, color.to_hex(), opacity=0.3 * intensity)
-        gradient.add_stop_color(0.5, color.to_hex(), opacity=0.1 * intensity)
-        gradient.add_stop_color(1, color.to_hex(), opacity=0)
+        stops = _fading_stops_markup(color.to_hex(), intensity)
         
         self.dwg.defs.add(gradient)
+        self._fill_element(gradient, stops)
         
         # Add glow circle
         glow_circle = self.dwg.circle(
@@ -456,28 +778,33 @@ class SVGRenderer:
             raise ValueError("Drawing not initialized.")
         
         # Add CSS animation for subtle pulsing
-        style = self.dwg.style("""
-            @keyframes pulse {
-                0%, 100% { opacity: 0.8; }
-                50% { opacity: 1; }
-            }
-            @keyframes rotate {
-                from { transform: rotate(0deg); }
-                to { transform: rotate(360deg); }
-            }
-            #aura-paths {
-                animation: pulse 4s ease-in-out infinite;
-                transform-origin: center;
-            }
-        """)
-        self.dwg.defs.add(style)
-    
-    def save(self, filename: Optional[str] = None) -> str:
+        self.dwg.defs.add(self.dwg.style(_ANIMATION_CSS))
+    
+    def to_string(self) -> str:
+        """
+        Serialize the drawing to SVG markup, exactly as save() writes it.
+        
+        Returns:
+            Complete SVG document including the XML declaration.
+        """
+        if self.dwg is None:
+            raise ValueError("Drawing not initialized.")
+        
+        buffer = io.StringIO()
+        self.dwg.write(buffer)
+        svg = buffer.getvalue()
+        
+        for placeholder, filled in self._splices:
+            svg = svg.replace(placeholder, filled, 1)
+        return svg
+    
+    def save(self, filename: Optional[str] = None, compress: bool = False) -> str:
         """
         Save the SVG to file.
         
         Args:
             filename: Optional override filename.
+            compress: Write gzip-compressed SVGZ (suffix becomes .svgz).
             
         Returns:
             Saved filename.
@@ -487,34 +814,62 @@ class SVGRenderer:
         
         if filename:
             self.dwg.filename = filename
-            
-        self.dwg.save()
-        return self.dwg.filename
+        
+        return write_svg(self.to_string(), self.dwg.filename, compress=compress)
 
 
-def render_aura(
-    paths_with_opacity: list[tuple[list[tuple[float, float]], float]],
+def write_svg(svg: str, output_path: str, compress: bool = False) -> str:
+    """
+    Write SVG markup to disk, optionally as gzip-compressed SVGZ.
+    
+    Compression uses level 1: path data shrinks several-fold at almost
+    no CPU cost, and browsers render .svgz directly. Note that raw file
+    hosts (e.g. raw.githubusercontent.com) do not send the gzip
+    Content-Encoding, so keep plain SVG for README embedding.
+    
+    Args:
+        svg: SVG document.
+        output_path: Destination path.
+        compress: Write SVGZ; the suffix is changed to .svgz.
+        
+    Returns:
+        Path actually written.
+    """
+    data = svg.encode("utf-8")
+    if not compress:
+        with open(output_path, "wb") as f:
+            f.write(data)
+        return output_path
+    
+    output_path = str(Path(output_path).with_suffix(".svgz"))
+    with gzip.open(output_path, "wb", compresslevel=1) as f:
+        f.write(data)
+    return output_path
+
+
+def build_aura_svg(
+    paths_with_opacity: list[tuple[PathPoints, float]],
     languages: list[dict],
     glow_intensity: float,
-    output_path: str = "aura.svg",
     width: int = 800,
     height: int = 800,
-    animate: bool = True
+    animate: bool = True,
+    path_steps: Optional[int] = None
 ) -> str:
     """
-    High-level function to render a complete aura SVG.
+    Build a complete aura SVG document in memory.
     
     Args:
         paths_with_opacity: Particle paths from generative engine.
         languages: Language data for color palette.
         glow_intensity: Glow effect intensity (0-1).
-        output_path: Output SVG file path.
         width: SVG width.
         height: SVG height.
         animate: Whether to add animation.
+        path_steps: Simulation steps per path, for strided paths.
         
     Returns:
-        Path to saved SVG file.
+        SVG markup as a string.
     """
     # Generate color palette
     palette_gen = ColorPaletteGenerator(languages)
@@ -523,7 +878,7 @@ def render_aura(
     
     # Create renderer
     renderer = SVGRenderer(width, height)
-    renderer.create_drawing(output_path)
+    renderer.create_drawing()
     
     # Add central glow first (behind paths)
     renderer.add_center_glow(base_color, glow_intensity)
@@ -532,12 +887,53 @@ def render_aura(
     renderer.render_paths(
         paths_with_opacity,
         palette,
-        glow_intensity=glow_intensity
+        glow_intensity=glow_intensity,
+        path_steps=path_steps
     )
     
     # Add animation if requested
     if animate:
         renderer.add_animation()
     
-    # Save and return path
-    return renderer.save(output_path)
+    return renderer.to_string()
+
+
+def render_aura(
+    paths_with_opacity: list[tuple[PathPoints, float]],
+    languages: list[dict],
+    glow_intensity: float,
+    output_path: str = "aura.svg",
+    width: int = 800,
+    height: int = 800,
+    animate: bool = True,
+    compress: bool = False,
+    path_steps: Optional[int] = None
+) -> str:
+    """
+    High-level function to render a complete aura SVG.
+    
+    Args:
+        paths_with_opacity: Particle paths from generative engine.
+        languages: Language data for color palette.
+        glow_intensity: Glow effect intensity (0-1).
+        output_path: Output SVG file path.
+        width: SVG width.
+        height: SVG height.
+        animate: Whether to add animation.
+        compress: Write gzip-compressed SVGZ (suffix becomes .svgz).
+        path_steps: Simulation steps per path, for strided paths.
+        
+    Returns:
+        Path to saved SVG file.
+    """
+    svg = build_aura_svg(
+        paths_with_opacity,
+        languages,
+        glow_intensity,
+        width=width,
+        height=height,
+        animate=animate,
+        path_steps=path_steps
+    )
+    
+    return write_svg(svg, output_path, compress=compress)